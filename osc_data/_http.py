@@ -0,0 +1,32 @@
+import threading
+
+# Connection pool sizes for each thread's session; pool_maxsize bounds the
+# number of pooled connections per host. Callers: Audio.load / Audio.aload,
+# Image.load and Video.extract_audio (Video.load streams through libavformat).
+_POOL_CONNECTIONS = 16
+_POOL_MAXSIZE = 32
+
+_local = threading.local()
+
+
+def session():
+    """Per-thread ``requests.Session`` reusing TCP/TLS connections across downloads.
+
+    ``requests.Session`` is not thread-safe (cookies, adapters), so each thread
+    (e.g. each executor worker used by ``Audio.aload``) gets its own session;
+    long-lived worker threads keep their connections warm across calls.
+    ``requests`` is imported on first download rather than at module import.
+    """
+    s = getattr(_local, "session", None)
+    if s is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        s = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE
+        )
+        s.mount("http://", adapter)
+        s.mount("https://", adapter)
+        _local.session = s
+    return s
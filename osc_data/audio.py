@@ -1,15 +1,57 @@
 from typing import Union
 from pathlib import Path
 from io import BytesIO
+from functools import partial
+import asyncio
 
 import av
-import librosa
 import numpy as np
-import requests
 from docarray import BaseDoc
 from docarray.typing import NdArray
+from numpy.lib.stride_tricks import sliding_window_view
 from pydantic import Field, ConfigDict
 
+from ._core import audio as core_audio
+from ._http import session
+
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+# Above this many elements the strided NumPy copy beats the per-frame Rust loop
+_LFR_RUST_MAX_SIZE = 1 << 14
+
+
+def _read_audio(
+    source: Union[str, BytesIO], sample_rate: int | None, mono: bool | None
+) -> tuple[np.ndarray, int]:
+    """Decode audio with soundfile, resampling only when needed.
+
+    Matches ``librosa.load`` output (float32, ``(channels, samples)`` for
+    multi-channel) without its per-call overhead. Paths libsndfile cannot
+    open (e.g. some MP3/M4A) fall back to ``librosa.load`` / audioread.
+
+    Returns:
+        tuple: (data, sample_rate)
+    """
+    # soundfile/librosa are imported lazily to keep `import osc_data` cheap
+    import soundfile as sf
+
+    try:
+        data, native_sr = sf.read(source, dtype="float32", always_2d=False)
+    except sf.SoundFileRuntimeError:
+        if not isinstance(source, str):
+            raise
+        import librosa
+
+        return librosa.load(source, sr=sample_rate, mono=mono)
+    data = data.T
+    if mono and data.ndim == 2:
+        data = data.mean(axis=0)
+    if sample_rate is not None and sample_rate != native_sr:
+        import librosa
+
+        data = librosa.resample(data, orig_sr=native_sr, target_sr=sample_rate)
+        return data, sample_rate
+    return data, native_sr
+
 
 class Audio(BaseDoc):
     """Audio object that represents an audio file.
@@ -46,18 +88,37 @@ class Audio(BaseDoc):
         """
         try:
             if Path(self.uri).exists():
-                data, sample_rate = librosa.load(self.uri, sr=sample_rate, mono=mono)
+                data, sample_rate = _read_audio(str(self.uri), sample_rate, mono)
             else:
-                bytes_ = requests.get(self.uri).content
-                data, sample_rate = librosa.load(
-                    BytesIO(bytes_), sr=sample_rate, mono=mono
-                )
+                buffer = BytesIO()
+                with session().get(self.uri, stream=True) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_content(_DOWNLOAD_CHUNK_SIZE):
+                        buffer.write(chunk)
+                buffer.seek(0)
+                data, sample_rate = _read_audio(buffer, sample_rate, mono)
             self.data = data
             self.sample_rate = sample_rate
         except Exception as e:
             raise ValueError(f"Failed to load audio from {self.uri}. {e}")
         return self
 
+    async def aload(
+        self, sample_rate: int | None = None, mono: bool | None = None
+    ) -> "Audio":
+        """Async version of :meth:`load` for use inside an event loop.
+
+        Download and decoding run in the loop's default executor, so the event
+        loop is not blocked; gather several ``aload`` calls to overlap them.
+
+        Example:
+            >>> audios = await asyncio.gather(
+            ...     Audio(uri="a.wav").aload(), Audio(uri="b.wav").aload()
+            ... )
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self.load, sample_rate, mono))
+
     def load_example(self) -> "Audio":
         """Load the built-in example audio file.
 
@@ -219,11 +280,101 @@ class Audio(BaseDoc):
         )
 
     @property
-    def duration_s(self):
-        """Get the duration of the audio file in seconds."""
-        return librosa.get_duration(y=self.data, sr=self.sample_rate)
+    def duration_s(self) -> float:
+        """Get the duration of the audio file in seconds (0.0 if not loaded)."""
+        if self.data is None or not self.sample_rate:
+            return 0.0
+        return self.data.shape[-1] / self.sample_rate
 
     @property
-    def duration_ms(self):
-        """Get the duration of the audio file in milliseconds."""
-        return self.duration_s * 1000
+    def duration_ms(self) -> float:
+        """Get the duration of the audio file in milliseconds (0.0 if not loaded)."""
+        if self.data is None or not self.sample_rate:
+            return 0.0
+        return self.data.shape[-1] * 1000 / self.sample_rate
+
+
+def compute_decibel(frames: np.ndarray) -> np.ndarray:
+    """Compute the power of each frame in decibels.
+
+    ``dB = 10 * log10(sum(frame ** 2) + 1e-6)``. float64 and integer input go
+    through the fused, parallel Rust kernel (integers are cast to float64 first
+    so the squares cannot overflow); other float dtypes use a fused ``einsum``
+    accumulating in at least float32, so the input is not squared into a
+    full-size temporary.
+
+    Args:
+        frames (np.ndarray): Audio frames of shape (n_frames, frame_len).
+
+    Returns:
+        np.ndarray: Decibel values of shape (n_frames, 1).
+
+    Examples:
+        >>> import numpy as np
+        >>> from osc_data.audio import compute_decibel
+        >>> frames = np.random.rand(100, 400)
+        >>> compute_decibel(frames).shape
+        (100, 1)
+    """
+    frames = np.asarray(frames)
+    if not np.issubdtype(frames.dtype, np.floating):
+        frames = frames.astype(np.float64)
+    if frames.dtype == np.float64:
+        return core_audio.compute_decibel(frames)
+    # Accumulate in at least float32; float16 sums overflow to inf
+    acc_dtype = np.promote_types(frames.dtype, np.float32)
+    power = np.einsum("ij,ij->i", frames, frames, dtype=acc_dtype)[:, None]
+    return np.log10(power + 1e-6) * 10
+
+
+def low_frame_rate(frames: np.ndarray, m: int, n: int) -> np.ndarray:
+    """Stack every ``m`` consecutive frames with stride ``n`` (LFR).
+
+    The sequence is left-padded with ``(m - 1) // 2`` copies of the first
+    frame and right-padded with the last frame. Small inputs go through the
+    Rust core; larger ones use a zero-copy ``sliding_window_view`` followed by
+    a single reshape copy, which is faster there.
+
+    Args:
+        frames (np.ndarray): Input of shape (batch_size, n_frames, n_hidden).
+        m (int): Number of frames stacked into each output frame.
+        n (int): Stride between output frames.
+
+    Returns:
+        np.ndarray: Array of shape (batch_size, ceil(n_frames / n), n_hidden * m).
+
+    Examples:
+        >>> import numpy as np
+        >>> from osc_data.audio import low_frame_rate
+        >>> feats = np.random.randn(1, 100, 80)
+        >>> low_frame_rate(feats, 7, 6).shape
+        (1, 17, 560)
+    """
+    frames = np.asarray(frames)
+    if (
+        frames.size <= _LFR_RUST_MAX_SIZE
+        and frames.dtype == np.float64
+        and frames.shape[1] >= m
+    ):
+        return core_audio.low_frame_rate(frames, m, n)
+    return _numpy_low_frame_rate(frames, m, n)
+
+
+def _numpy_low_frame_rate(frames: np.ndarray, m: int, n: int) -> np.ndarray:
+    batch_size, n_frames, n_hidden = frames.shape
+    n_output_frames = -(-n_frames // n)
+    left = (m - 1) // 2
+    right = max(0, (n_output_frames - 1) * n + m - (n_frames + left))
+    padded = np.concatenate(
+        [
+            np.repeat(frames[:, :1], left, axis=1),
+            frames,
+            np.repeat(frames[:, -1:], right, axis=1),
+        ],
+        axis=1,
+    )
+    # (B, L - m + 1, n_hidden, m) view -> keep every n-th window
+    windows = sliding_window_view(padded, m, axis=1)[:, ::n][:, :n_output_frames]
+    return windows.transpose(0, 1, 3, 2).reshape(
+        batch_size, n_output_frames, m * n_hidden
+    )
@@ -3,13 +3,12 @@ import math
 from pathlib import Path
 from typing import ClassVar
 
-import requests
-
 import numpy as np
 from docarray import BaseDoc
 from docarray.typing import ImageNdArray, ImageUrl
 from pydantic import Field, ConfigDict
 
+from osc_data._http import session
 from osc_data._core import (
     convert_to_rgb,
     resize_image,
@@ -70,7 +69,7 @@ class Image(BaseDoc):
         else:
             # Load from URL
             try:
-                response = requests.get(str(self.uri), timeout=30)
+                response = session().get(str(self.uri), timeout=30)
                 response.raise_for_status()
                 img_bytes = response.content
             except Exception as e:
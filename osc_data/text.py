@@ -1,11 +1,49 @@
+import re
+from functools import cache, lru_cache
 from pathlib import Path
+from threading import Lock
+from typing import Callable, List
 
 from kaldifst import TextNormalizer as KaldiTextNormalizer
-from pydantic import BaseModel, model_validator, ConfigDict
+from pydantic import BaseModel, model_validator, ConfigDict, PrivateAttr
 
 from ._core import text as core_text
 from ._core import reorder as core_reorder
 
+_TN_ASSETS_DIR = Path(__file__).parent / "assets" / "text" / "tn"
+
+# Kaldi FST application is not reentrant; the default FSTs are shared by all
+# TextNormalizer instances, so the lock is shared too.
+_FST_LOCK = Lock()
+
+# Tagger cost grows faster than linearly with input length, so long inputs are
+# tagged one sentence at a time. No TN rule spans a full-width sentence end.
+_SENTENCE_END_RE = re.compile(r"(?<=[。！？])")
+
+
+@cache
+def _load_fst(name: str) -> KaldiTextNormalizer:
+    """Load a bundled TN FST once per process, on first use."""
+    return KaldiTextNormalizer(str(_TN_ASSETS_DIR / name))
+
+
+def preload_fsts() -> None:
+    """Load all bundled TN FSTs into the process-wide cache.
+
+    Call this in the parent process before forking workers (e.g. from a
+    gunicorn ``preload_app = True`` config or before starting a
+    ``multiprocessing`` fork pool). The FSTs are never written after loading,
+    so forked workers share the parent's pages instead of each loading their
+    own copy.
+
+    Example:
+        >>> from osc_data.text import preload_fsts, TextNormalizer
+        >>> preload_fsts()
+        >>> normalizer = TextNormalizer()  # reuses the preloaded FSTs
+    """
+    for name in ("tagger.fst", "verbalizer.fst", "verbalizer_remove_erhua.fst"):
+        _load_fst(name)
+
 
 class TextNormalizer(BaseModel):
     model_config: ConfigDict = ConfigDict(arbitrary_types_allowed=True)
@@ -13,49 +51,89 @@ class TextNormalizer(BaseModel):
     remove_erhua: bool = False
     remove_emoji: bool = False
     to_half_width: bool = False
+    cache_size: int = 4096
     tagger: KaldiTextNormalizer = None
     reorder: core_reorder.Reorder = None
     verbalizer: KaldiTextNormalizer = None
+    _cache: Callable[[str], str] = PrivateAttr(None)
 
     @model_validator(mode="after")
     def setup_model(self) -> "TextNormalizer":
         if self.tagger is None:
-            self.tagger = KaldiTextNormalizer(
-                str(Path(__file__).parent / "assets" / "text" / "tn" / "tagger.fst")
-            )
+            self.tagger = _load_fst("tagger.fst")
         if self.verbalizer is None:
             if self.remove_erhua:
-                self.verbalizer = KaldiTextNormalizer(
-                    str(
-                        Path(__file__).parent
-                        / "assets"
-                        / "text"
-                        / "tn"
-                        / "verbalizer_remove_erhua.fst"
-                    )
-                )
+                self.verbalizer = _load_fst("verbalizer_remove_erhua.fst")
             else:
-                self.verbalizer = KaldiTextNormalizer(
-                    str(
-                        Path(__file__).parent
-                        / "assets"
-                        / "text"
-                        / "tn"
-                        / "verbalizer.fst"
-                    )
-                )
+                self.verbalizer = _load_fst("verbalizer.fst")
         if self.reorder is None:
             self.reorder = core_reorder.Reorder()
+        self._build_cache()
         return self
 
+    def __copy__(self) -> "TextNormalizer":
+        # model_copy() copies private attributes as-is; rebind the cache so the
+        # copy neither shares it nor runs the original's settings
+        copied = super().__copy__()
+        copied._build_cache()
+        return copied
+
+    def _build_cache(self) -> None:
+        self._cache = lru_cache(maxsize=self.cache_size)(self._normalize)
+
     def normalize(self, text: str) -> str:
+        """Normalize text, returning cached results for repeated inputs.
+
+        Args:
+            text (str): Text to normalize.
+
+        Returns:
+            str: Normalized text.
+
+        Example:
+            >>> normalizer = TextNormalizer()
+            >>> normalizer.normalize("我有100元")
+            '我有一百元'
+        """
+        return self._cache(text)
+
+    def batch_normalize(self, texts: List[str]) -> List[str]:
+        """Normalize a batch of texts, sharing the normalize cache.
+
+        Args:
+            texts (List[str]): Texts to normalize.
+
+        Returns:
+            List[str]: Normalized texts, in input order.
+
+        Example:
+            >>> normalizer = TextNormalizer()
+            >>> normalizer.batch_normalize(["我有100元", "今天是3月15日"])
+            ['我有一百元', '今天是三月十五日']
+        """
+        return [self.normalize(text) for text in texts]
+
+    def cache_clear(self) -> None:
+        """Clear the normalize cache, e.g. after replacing tagger/verbalizer/reorder."""
+        self._cache.cache_clear()
+
+    def _normalize(self, text: str) -> str:
         if self.remove_emoji:
             text = core_text.remove_emojis(text)
         if self.to_half_width:
             text = core_text.to_half_width(text)
-        text = self.tagger(text)
+        return "".join(
+            self._tag_and_verbalize(sentence)
+            for sentence in _SENTENCE_END_RE.split(text)
+            if sentence
+        )
+
+    def _tag_and_verbalize(self, text: str) -> str:
+        with _FST_LOCK:
+            text = self.tagger(text)
         text = self.reorder.reorder(text)
-        text = self.verbalizer(text)
+        with _FST_LOCK:
+            text = self.verbalizer(text)
         return text
 
 
@@ -2,6 +2,11 @@ from typing import List
 
 from ._core import text_stream as core_text_stream
 
+# Default split characters; only user-supplied lists are validated in __init__
+_L1_ENDS = ["!", "?", "。", "？", "！", "；", ";"]
+_L2_ENDS = ["、", ",", "，"]
+_L3_ENDS = [":", "："]
+
 
 class TextStreamSentencizer:
     def __init__(
@@ -9,9 +14,9 @@ class TextStreamSentencizer:
         min_sentence_length: int = 10,
         use_level2_threshold: int = 50,
         use_level3_threshold: int = 100,
-        l1_ends: List[str] = ["!", "?", "。", "？", "！", "；", ";"],
-        l2_ends: List[str] = ["、", ",", "，"],
-        l3_ends: List[str] = [":", "："],
+        l1_ends: List[str] = _L1_ENDS,
+        l2_ends: List[str] = _L2_ENDS,
+        l3_ends: List[str] = _L3_ENDS,
         remove_emoji: bool = False,
     ):
         """
@@ -40,11 +45,8 @@ class TextStreamSentencizer:
             >>> # 流式输入文本
             >>> text = "你好！这是第一句话。这是第二句话。"
             >>>
-            >>> # 逐字符推送，获取完成的句子
-            >>> sentences = []
-            >>> for char in text:
-            ...     completed = sentencizer.push(char)
-            ...     sentences.extend(completed)
+            >>> # 推送文本块（与逐字符 push 结果一致），获取完成的句子
+            >>> sentences = sentencizer.feed(text)
             >>>
             >>> # 刷新缓冲区，获取剩余内容
             >>> sentences.extend(sentencizer.flush())
@@ -56,19 +58,22 @@ class TextStreamSentencizer:
             >>> sentencizer2 = TextStreamSentencizer(min_sentence_length=10, remove_emoji=True)
             >>> long_text = "有个阿姨特别聪明，她同时接两个钟点工单😊，上午一家下午一家，收入比全职还高！现在客户都抢着要她。"
             >>>
-            >>> sentences2 = []
-            >>> for char in long_text:
-            ...     completed = sentencizer2.push(char)
-            ...     sentences2.extend(completed)
+            >>> sentences2 = sentencizer2.feed(long_text)
             >>> sentences2.extend(sentencizer2.flush())
             >>>
             >>> print(sentences2)
             ['有个阿姨特别聪明，她同时接两个钟点工单，上午一家下午一家，收入比全职还高！', '现在客户都抢着要她。']
         """
         super().__init__()
-        assert check_all_chars(l1_ends), "l1_ends must be a list of chars"
-        assert check_all_chars(l2_ends), "l2_ends must be a list of chars"
-        assert check_all_chars(l3_ends), "l3_ends must be a list of chars"
+        assert l1_ends is _L1_ENDS or check_all_chars(l1_ends), (
+            "l1_ends must be a list of chars"
+        )
+        assert l2_ends is _L2_ENDS or check_all_chars(l2_ends), (
+            "l2_ends must be a list of chars"
+        )
+        assert l3_ends is _L3_ENDS or check_all_chars(l3_ends), (
+            "l3_ends must be a list of chars"
+        )
         self._sentencizer = core_text_stream.TextStreamSentencizer(
             min_sentence_length=min_sentence_length,
             use_level2_threshold=use_level2_threshold,
@@ -99,6 +104,26 @@ class TextStreamSentencizer:
         """
         return self._sentencizer.push(text)
 
+    def feed(self, text: str) -> List[str]:
+        """Feed a chunk of text and get completed sentences.
+
+        Equivalent to calling :meth:`push` once per character, but the whole
+        chunk is processed in a single call into the Rust core, avoiding the
+        per-character Python/Rust round trip.
+
+        Args:
+            text (str): Text chunk to feed into the stream.
+
+        Returns:
+            List[str]: List of completed sentences detected from the stream.
+
+        Example:
+            >>> sentencizer = TextStreamSentencizer(min_sentence_length=5)
+            >>> sentencizer.feed("你好！这是第一句话。这是第二")
+            ['你好！这是第一句话。']
+        """
+        return self._sentencizer.feed(text)
+
     def flush(self) -> List[str]:
         """Flush the buffer and return remaining content as sentences.
 
@@ -127,7 +152,4 @@ def check_all_chars(text: List[str]) -> bool:
     Returns:
         bool: True if all elements are single-character strings, False otherwise.
     """
-    for char in text:
-        if len(char) != 1 or not isinstance(char, str):
-            return False
-    return True
+    return all(type(char) is str and len(char) == 1 for char in text)
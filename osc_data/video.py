@@ -1,23 +1,156 @@
 from __future__ import annotations
 from pathlib import Path
 from io import BytesIO
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from fractions import Fraction
+from functools import partial
+from typing import Callable, Iterator
+import asyncio
 import shutil
 import tempfile
+import weakref
 
 import av
 import numpy as np
 from docarray import BaseDoc
 from docarray.typing import VideoNdArray, VideoUrl
-from pydantic import Field, ConfigDict
-import requests
+from pydantic import Field, ConfigDict, PrivateAttr
 from wasabi import Printer
 
+from osc_data._http import session
 from osc_data.audio import Audio
 
 # Initialize wasabi printer
 msg = Printer()
 
+# Frames converted ahead of the encoder in Video.save
+_SAVE_PREFETCH_FRAMES = 8
+
+
+def _rgb_to_yuv420p_converter(width: int, height: int):
+    """Build an RGB (H, W, 3) -> yuv420p ``VideoFrame`` converter.
+
+    Every call copies into the same rgb24 frame instead of allocating a new
+    one with ``from_ndarray`` (about half the per-frame cost at 1080p), so the
+    converter must not be called from several threads at once.
+    """
+    rgb_frame = av.VideoFrame(width, height, "rgb24")
+    plane = rgb_frame.planes[0]
+    rows = np.frombuffer(plane, np.uint8).reshape(height, plane.line_size)
+    rows = rows[:, : width * 3]
+
+    def convert(frame_data: np.ndarray) -> av.VideoFrame:
+        rows[...] = frame_data.reshape(height, -1)
+        return rgb_frame.reformat(format="yuv420p")
+
+    return convert
+
+
+def _open_input(source: str | BytesIO, hwaccel: str | None = None, **kwargs):
+    """Open a media source for decoding, optionally on a hardware decoder.
+
+    Args:
+        source: Path/URL or file-like object.
+        hwaccel: FFmpeg hardware device type (e.g. "cuda" for NVDEC,
+            "videotoolbox", "vaapi", "qsv"). Falls back to software decoding
+            if the device cannot be created.
+        **kwargs: Passed to ``av.open`` (e.g. ``timeout``).
+    """
+    if hwaccel is None:
+        return av.open(source, **kwargs)
+    from av.codec.hwaccel import HWAccel
+
+    try:
+        return av.open(source, hwaccel=HWAccel(device_type=hwaccel), **kwargs)
+    except av.FFmpegError as e:
+        msg.warn(f"Hardware decoding ({hwaccel}) unavailable, using software: {e}")
+        if isinstance(source, BytesIO):
+            source.seek(0)
+        return av.open(source, **kwargs)
+
+
+def _empty_frames(shape: tuple[int, ...]) -> np.ndarray:
+    return np.empty(shape, dtype=np.uint8)
+
+
+def _empty_pinned_frames(shape: tuple[int, ...]) -> np.ndarray:
+    """Allocate a page-locked (pinned) host buffer, for fast DMA to the GPU."""
+    try:
+        import torch
+    except ImportError as e:
+        raise ImportError("pin_memory=True requires torch to be installed") from e
+    return torch.empty(shape, dtype=torch.uint8, pin_memory=True).numpy()
+
+
+def _decode_frames(
+    container: av.container.InputContainer,
+    stride: int = 1,
+    max_frames: int | None = None,
+    empty: Callable[[tuple[int, ...]], np.ndarray] = _empty_frames,
+) -> tuple[np.ndarray | None, list[int]]:
+    """Decode the first video stream into one (N, H, W, 3) RGB array.
+
+    The output buffer is preallocated from the stream's frame count (or its
+    duration when the count is missing) and each frame is converted straight
+    into it, so peak memory stays at one copy of the video instead of a list
+    of frames plus the stacked result.
+
+    Only every ``stride``-th frame is converted to RGB; the others are decoded
+    (to advance the decoder) but never go through the colorspace conversion.
+    Decoding stops once ``max_frames`` frames have been kept.
+
+    ``empty`` allocates the uint8 output buffer for a given shape. Buffers it
+    returns that do not own their memory (e.g. pinned memory borrowed from
+    torch) are grown by reallocating and copying, and trimmed with a view.
+
+    Returns:
+        tuple: (frames or None if the stream has no frames, key frame indices).
+            A key frame that is skipped by ``stride`` is mapped to the next
+            kept frame.
+    """
+    stream = container.streams.video[0]
+    capacity = stream.frames
+    if capacity <= 0 and stream.duration and stream.average_rate:
+        capacity = int(stream.duration * stream.time_base * stream.average_rate) + 1
+    capacity = -(-capacity // stride)
+    if max_frames is not None:
+        capacity = min(capacity, max_frames)
+    capacity = max(capacity, 1)
+
+    data = None
+    key_frames = []
+    n = 0
+    for i, frame in enumerate(container.decode(stream)):
+        if max_frames is not None and n >= max_frames:
+            break
+        if frame.key_frame and (not key_frames or key_frames[-1] != n):
+            key_frames.append(n)
+        if i % stride:
+            continue
+        if data is None:
+            data = empty((capacity, frame.height, frame.width, 3))
+        elif n == len(data):
+            # Frame count was underestimated: grow geometrically
+            if data.flags.owndata:
+                data.resize((2 * len(data),) + data.shape[1:], refcheck=False)
+            else:
+                grown = empty((2 * len(data),) + data.shape[1:])
+                grown[:n] = data
+                data = grown
+        data[n] = frame.to_ndarray(format="rgb24")
+        n += 1
+
+    if data is None:
+        return None, []
+    if n != len(data):
+        if data.flags.owndata:
+            data.resize((n,) + data.shape[1:], refcheck=False)
+        else:
+            data = data[:n]
+    # Drop a key frame recorded past the last kept frame
+    return data, [k for k in key_frames if k < n]
+
 
 class Video(BaseDoc):
     """Video object that represents a video file.
@@ -46,73 +179,151 @@ class Video(BaseDoc):
     prompt: str | None = Field(
         None, description="Prompt text used to generate this video."
     )
+    # (weakref to data, planar) pair; reused only while ``data`` is the same
+    # array, and dropped when ``data`` is reassigned so neither stays alive
+    _planar_cache: tuple[weakref.ref, np.ndarray] | None = PrivateAttr(None)
+
+    def __setattr__(self, name, value):
+        if name == "data":
+            self.__pydantic_private__["_planar_cache"] = None
+        super().__setattr__(name, value)
+
+    def load(
+        self,
+        stride: int = 1,
+        max_frames: int | None = None,
+        hwaccel: str | None = None,
+        pin_memory: bool = False,
+    ) -> "Video":
+        """Load the video from local path or URL using av library.
+
+        Args:
+            stride (int): Keep every ``stride``-th frame. Skipped frames are
+                decoded but not converted to RGB, so sampling is much cheaper
+                than loading everything and slicing. ``fps`` is divided by
+                ``stride`` accordingly (but kept at least 1).
+            max_frames (int | None): Stop decoding after this many kept frames
+                (must be >= 1). If decoding stops early, ``duration`` reflects
+                the loaded frames.
+            hwaccel (str | None): Decode on a hardware device, e.g. "cuda"
+                (NVDEC). Frames are copied back to host memory, so ``data``
+                is a NumPy array as usual. Falls back to software decoding
+                when the device is unavailable.
+            pin_memory (bool): Decode into page-locked host memory allocated
+                through torch, so moving ``data`` to the GPU with
+                ``torch.from_numpy(video.data).cuda(non_blocking=True)`` is a
+                full-bandwidth DMA copy. Requires torch with CUDA.
 
-    def load(self) -> "Video":
-        """Load the video from local path or URL using av library."""
+        Examples:
+            >>> from osc_data.video import Video
+            >>> video = Video(uri="input.mp4").load(stride=5, max_frames=100)
+            >>> video = Video(uri="input.mp4").load(hwaccel="cuda")
+            >>> video = Video(uri="input.mp4").load(pin_memory=True)
+        """
         if self.uri is None:
             raise ValueError("Video URI is not set")
+        if stride < 1:
+            raise ValueError("stride must be >= 1")
+        if max_frames is not None and max_frames < 1:
+            raise ValueError("max_frames must be >= 1")
+        empty = _empty_pinned_frames if pin_memory else _empty_frames
 
-        # load local video
         if Path(self.uri).exists():
-            try:
-                with av.open(str(self.uri)) as container:
-                    video_stream = container.streams.video[0]
-
-                    # 获取视频基本信息
-                    self.fps = round(video_stream.average_rate)
-                    self.duration = round(
-                        float(video_stream.duration * video_stream.time_base), 2
-                    )
-
-                    # 提取所有帧和关键帧
-                    frames = []
-                    key_frame_indices = []
-
-                    for i, frame in enumerate(container.decode(video=0)):
-                        # 转换为RGB格式的numpy数组
-                        frame_rgb = frame.to_ndarray(format="rgb24")
-                        frames.append(frame_rgb)
-
-                        # 检查是否为关键帧
-                        if frame.key_frame:
-                            key_frame_indices.append(i)
-
-                    # 将帧数据组合成VideoNdArray格式 (N, H, W, 3)
-                    if frames:
-                        self.data = np.array(frames, dtype=np.uint8)
-                        self.key_frames = key_frame_indices
-                    else:
-                        self.data = None
-                        self.key_frames = []
-
-            except Exception as e:
-                msg.fail(f"Failed to load video: {e}")
-                raise RuntimeError(f"Failed to load video: {e}") from e
-            return self
-        # load remote video
-        else:
-            try:
-                response = requests.get(self.uri)
-                with av.open(BytesIO(response.content)) as container:
-                    video_stream = container.streams.video[0]
-                    self.fps = round(video_stream.average_rate)
-                    self.duration = round(
-                        float(video_stream.duration * video_stream.time_base), 2
-                    )
-                    frames = []
-                    key_frame_indices = []
-                    for i, frame in enumerate(container.decode(video=0)):
-                        frame_rgb = frame.to_ndarray(format="rgb24")
-                        frames.append(frame_rgb)
-                        if frame.key_frame:
-                            key_frame_indices.append(i)
-                    if frames:
-                        self.data = np.array(frames, dtype=np.uint8)
-                        self.key_frames = key_frame_indices
-
-            except Exception as e:
-                msg.fail(f"Failed to load video from URL: {e}")
-                raise RuntimeError(f"Failed to load video: {e}") from e
+            return self._decode(str(self.uri), stride, max_frames, hwaccel, empty)
+        # libavformat reads the URL incrementally (with range requests when it
+        # needs to seek), so decoding starts before the whole file is
+        # downloaded and the encoded file is never held in RAM
+        return self._decode(
+            str(self.uri), stride, max_frames, hwaccel, empty, timeout=30
+        )
+
+    def _decode(
+        self,
+        source: str | BytesIO,
+        stride: int,
+        max_frames: int | None,
+        hwaccel: str | None,
+        empty: Callable[[tuple[int, ...]], np.ndarray],
+        **open_kwargs,
+    ) -> "Video":
+        """Open ``source`` (path, URL or file-like) once and decode it into self.
+
+        Metadata is read from the opened stream before decoding and the
+        container is not reopened; ``data``, ``key_frames``, ``fps`` and
+        ``duration`` are only assigned once decoding succeeded.
+        """
+        try:
+            with _open_input(source, hwaccel, **open_kwargs) as container:
+                video_stream = container.streams.video[0]
+                rate = float(video_stream.average_rate)
+                if video_stream.duration is not None:
+                    duration = float(video_stream.duration * video_stream.time_base)
+                else:
+                    # e.g. Matroska only stores the container duration
+                    duration = (container.duration or 0) / av.time_base
+
+                data, key_frames = _decode_frames(container, stride, max_frames, empty)
+        except Exception as e:
+            msg.fail(f"Failed to load video: {e}")
+            raise RuntimeError(f"Failed to load video: {e}") from e
+
+        if data is not None and len(data) == max_frames:
+            # Decoding may have stopped early; report the span actually covered
+            duration = min(duration, len(data) * stride / rate)
+        self.fps = max(1, round(rate / stride))
+        self.duration = round(duration, 2)
+        self.data, self.key_frames = data, key_frames
+        return self
+
+    async def aload(
+        self,
+        stride: int = 1,
+        max_frames: int | None = None,
+        hwaccel: str | None = None,
+        pin_memory: bool = False,
+    ) -> "Video":
+        """Async version of :meth:`load` for use inside an event loop.
+
+        Decoding runs in the loop's default executor (PyAV releases the GIL
+        while decoding), so the event loop is not blocked; gather several
+        ``aload`` calls to decode videos concurrently.
+
+        Examples:
+            >>> videos = await asyncio.gather(
+            ...     Video(uri="a.mp4").aload(), Video(uri="b.mp4").aload()
+            ... )
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, partial(self.load, stride, max_frames, hwaccel, pin_memory)
+        )
+
+    @classmethod
+    def load_many(
+        cls, uris: list[str | Path], num_workers: int = 4, **load_kwargs
+    ) -> list["Video"]:
+        """Load several videos concurrently on a thread pool.
+
+        File/network reads of one clip overlap with decoding of the others
+        (PyAV releases the GIL while reading and decoding), which keeps the
+        CPU busy when loading many clips.
+
+        Args:
+            uris (list[str | Path]): Local paths or URLs.
+            num_workers (int): Number of loader threads.
+            **load_kwargs: Passed to :meth:`load` (``stride``, ``max_frames``,
+                ``hwaccel``, ``pin_memory``).
+
+        Returns:
+            list[Video]: Loaded videos, in input order.
+
+        Examples:
+            >>> videos = Video.load_many(["a.mp4", "b.mp4"], stride=5)
+        """
+        with ThreadPoolExecutor(max_workers=num_workers) as pool:
+            return list(
+                pool.map(lambda uri: cls(uri=str(uri)).load(**load_kwargs), uris)
+            )
 
     def load_example(self) -> "Video":
         """Load the example video file.
@@ -124,22 +335,51 @@ class Video(BaseDoc):
         self.uri = str(example_path)
         return self.load()
 
-    def split_by_key_frames(self, min_split_duration_s: int = 5) -> list[VideoNdArray]:
-        """Split the video by key frames."""
+    def iter_key_frame_segments(
+        self, min_split_duration_s: int = 5
+    ) -> Iterator[VideoNdArray]:
+        """Lazily yield video segments split at key frames.
+
+        Segments are numpy views into ``self.data`` (no copy), so they share
+        storage with this video.
+
+        Args:
+            min_split_duration_s (int): Minimum segment duration in seconds;
+                key frames closer than this to the segment start are skipped.
+
+        Yields:
+            VideoNdArray: Frames (n, H, W, 3) of each segment.
+
+        Raises:
+            ValueError: If key frames are not set.
+
+        Examples:
+            >>> from osc_data.video import Video
+            >>> video = Video(uri="input.mp4").load()
+            >>> for segment in video.iter_key_frame_segments(min_split_duration_s=5):
+            ...     print(segment.shape)
+        """
         if self.key_frames is None:
             raise ValueError("Key frames are not set")
         if len(self.key_frames) == 0 or len(self.key_frames) == 1:
-            return [self.data]
-        videos = []
+            yield self.data
+            return
         start = 0
         min_split_frames = min_split_duration_s * self.fps
         for key_frame_idx in self.key_frames[1:]:
             if key_frame_idx - start < min_split_frames:
                 continue
-            videos.append(self.data[start:key_frame_idx])
+            yield self.data[start:key_frame_idx]
             start = key_frame_idx
-        videos.append(self.data[start:])
-        return videos
+        yield self.data[start:]
+
+    def split_by_key_frames(self, min_split_duration_s: int = 5) -> list[VideoNdArray]:
+        """Split the video by key frames.
+
+        Returns the segments of :meth:`iter_key_frame_segments` as a list of
+        views into ``self.data``.
+        """
+        return list(self.iter_key_frame_segments(min_split_duration_s))
 
     def save(self, path: str, format: str = "mp4", codec: str = "h264"):
         """将视频帧数据编码并保存到本地文件。
@@ -183,14 +423,20 @@ class Video(BaseDoc):
                 stream.height = self.data.shape[1]  # 高度
                 stream.pix_fmt = "yuv420p"  # 像素格式
 
-                for frame_data in self.data:
-                    # 创建VideoFrame对象
-                    frame = av.VideoFrame.from_ndarray(frame_data, format="rgb24")
-                    frame = frame.reformat(format="yuv420p")
-
-                    # 编码帧
-                    for packet in stream.encode(frame):
-                        container.mux(packet)
+                # RGB→YUV 转换在后台线程中提前进行，与编码重叠（PyAV 在两者中都释放 GIL）；
+                # 队列长度有上限，避免一次性转换全部帧占用内存
+                convert = _rgb_to_yuv420p_converter(stream.width, stream.height)
+                with ThreadPoolExecutor(max_workers=1) as pool:
+                    pending = deque()
+                    for frame_data in self.data:
+                        pending.append(pool.submit(convert, frame_data))
+                        if len(pending) < _SAVE_PREFETCH_FRAMES:
+                            continue
+                        for packet in stream.encode(pending.popleft().result()):
+                            container.mux(packet)
+                    while pending:
+                        for packet in stream.encode(pending.popleft().result()):
+                            container.mux(packet)
 
                 # 完成编码
                 for packet in stream.encode():
@@ -300,18 +546,21 @@ class Video(BaseDoc):
 
         from PIL import Image as PILImage
 
-        resized_frames = []
-        for frame in self.data:
+        # Preallocate the output so each resized frame is copied exactly once
+        resized_frames = np.empty(
+            (len(self.data), height, width) + self.data.shape[3:], dtype=np.uint8
+        )
+        for i, frame in enumerate(self.data):
             # Convert numpy array to PIL Image
             pil_img = PILImage.fromarray(frame)
             # Resize using bilinear interpolation
             resized = pil_img.resize((width, height), PILImage.Resampling.BILINEAR)
-            # Convert back to numpy array
-            resized_frames.append(np.array(resized))
+            # Write straight into the output buffer (no intermediate array)
+            resized_frames[i] = np.asarray(resized)
 
         return Video(
             uri=self.uri,
-            data=np.array(resized_frames, dtype=np.uint8),
+            data=resized_frames,
             fps=self.fps,
             duration=self.duration,
             has_audio=self.has_audio,
@@ -332,6 +581,25 @@ class Video(BaseDoc):
             return self.data.shape[1]
         return None
 
+    @property
+    def planar(self) -> np.ndarray | None:
+        """Frames as a contiguous planar (3, N, H, W) array.
+
+        Each channel is stored as one contiguous plane, so per-channel
+        operations (mean, histogram, colorspace conversion) read memory
+        sequentially instead of striding over interleaved RGB. The array is
+        computed on first access and cached until ``data`` is reassigned;
+        in-place edits to ``data`` are not reflected.
+        """
+        if self.data is None:
+            return None
+        # BaseDoc.__getattr__ bypasses pydantic's private attribute lookup
+        cache = self.__pydantic_private__["_planar_cache"]
+        if cache is None or cache[0]() is not self.data:
+            planar = np.ascontiguousarray(self.data.transpose(3, 0, 1, 2))
+            cache = self._planar_cache = (weakref.ref(self.data), planar)
+        return cache[1]
+
     def get_best_size(self, ratio: tuple[int, int]) -> tuple[int, int]:
         """根据指定宽高比，计算保持宽度不变时的最佳尺寸。
 
@@ -472,7 +740,7 @@ class Video(BaseDoc):
             if path.exists():
                 container = av.open(str(path))
             else:
-                response = requests.get(str(self.uri), timeout=30)
+                response = session().get(str(self.uri), timeout=30)
                 response.raise_for_status()
                 container = av.open(BytesIO(response.content))
 
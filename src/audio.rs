@@ -121,7 +121,7 @@ pub fn compute_decibel<'py>(
         .as_array()
         .axis_iter(Axis(0))
         .into_par_iter()
-        .map(|row| row.pow2().sum().add(1e-6).log10() * 10.)
+        .map(|row| row.dot(&row).add(1e-6).log10() * 10.)
         .collect_into_vec(&mut buffer);
     let decibels = Array::<f64, _>::from(buffer)
         .into_shape_with_order((frame_len, 1))
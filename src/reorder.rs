@@ -1,205 +1,189 @@
 use pyo3::prelude::*;
+use regex::Regex;
 use std::collections::HashMap;
-
-const EOS: char = '\0';
+use std::sync::OnceLock;
 
 /// 默认的排序规则
 fn default_orders() -> HashMap<String, Vec<String>> {
     let mut orders = HashMap::new();
-    orders.insert("date".to_string(), vec!["year".to_string(), "month".to_string(), "day".to_string()]);
-    orders.insert("fraction".to_string(), vec!["denominator".to_string(), "numerator".to_string()]);
-    orders.insert("measure".to_string(), vec!["denominator".to_string(), "numerator".to_string(), "value".to_string()]);
-    orders.insert("money".to_string(), vec!["value".to_string(), "currency".to_string()]);
-    orders.insert("time".to_string(), vec!["noon".to_string(), "hour".to_string(), "minute".to_string(), "second".to_string()]);
+    orders.insert(
+        "date".to_string(),
+        vec!["year".to_string(), "month".to_string(), "day".to_string()],
+    );
+    orders.insert(
+        "fraction".to_string(),
+        vec!["denominator".to_string(), "numerator".to_string()],
+    );
+    orders.insert(
+        "measure".to_string(),
+        vec![
+            "denominator".to_string(),
+            "numerator".to_string(),
+            "value".to_string(),
+        ],
+    );
+    orders.insert(
+        "money".to_string(),
+        vec!["value".to_string(), "currency".to_string()],
+    );
+    orders.insert(
+        "time".to_string(),
+        vec![
+            "noon".to_string(),
+            "hour".to_string(),
+            "minute".to_string(),
+            "second".to_string(),
+        ],
+    );
     orders
 }
 
 /// Token 结构体，表示解析后的标记
+///
+/// name/key/value 都直接借用输入文本的切片，解析过程不分配字符串。
 #[derive(Debug, Clone)]
-struct Token {
-    name: String,
-    order: Vec<String>,
-    members: HashMap<String, String>,
+struct Token<'a> {
+    name: &'a str,
+    members: Vec<(&'a str, &'a str)>,
 }
 
-impl Token {
-    fn new(name: String) -> Self {
+impl<'a> Token<'a> {
+    fn new(name: &'a str) -> Self {
         Token {
             name,
-            order: Vec::new(),
-            members: HashMap::new(),
+            members: Vec::new(),
         }
     }
 
-    fn append(&mut self, key: String, value: String) {
-        self.order.push(key.clone());
-        self.members.insert(key, value);
+    fn append(&mut self, key: &'a str, value: &'a str) {
+        self.members.push((key, value));
+    }
+
+    /// 查找 key 对应的值，重复的 key 以最后一次出现为准
+    fn get(&self, key: &str) -> Option<&'a str> {
+        self.members
+            .iter()
+            .rev()
+            .find(|(k, _)| *k == key)
+            .map(|(_, v)| *v)
     }
 
-    fn to_string(&self, orders: &HashMap<String, Vec<String>>) -> String {
-        let mut output = format!("{} {{", self.name);
-        
-        let mut current_order = self.order.clone();
-        
+    /// 按排序规则把 token 写入 output，不产生中间字符串
+    fn write_to(&self, output: &mut String, orders: &HashMap<String, Vec<String>>) {
+        output.push_str(self.name);
+        output.push_str(" {");
+
         // 如果存在预定义的顺序且不需要保留原顺序
-        if let Some(predefined_order) = orders.get(&self.name) {
-            if self.members.get("preserve_order") != Some(&"true".to_string()) {
-                current_order = predefined_order.clone();
+        match orders.get(self.name) {
+            Some(predefined_order) if self.get("preserve_order") != Some("true") => {
+                for key in predefined_order {
+                    if let Some(value) = self.get(key) {
+                        write_member(output, key, value);
+                    }
+                }
             }
-        }
-
-        for key in &current_order {
-            if let Some(value) = self.members.get(key) {
-                output.push_str(&format!(r#" {}: "{}""#, key, value));
+            _ => {
+                for (key, value) in &self.members {
+                    write_member(output, key, value);
+                }
             }
         }
-        
+
         output.push_str(" }");
-        output
     }
 }
 
+/// 写入单个成员：` key: "value"`
+fn write_member(output: &mut String, key: &str, value: &str) {
+    output.push(' ');
+    output.push_str(key);
+    output.push_str(": \"");
+    output.push_str(value);
+    output.push('"');
+}
+
+/// 匹配单个 token：`name { key: "value" ... }`
+///
+/// key 只由 ASCII 字母和下划线组成、空白只取 ASCII 空白，
+/// 比 Unicode 的 `\w`/`\s` 字符类小得多，匹配更快。
+static TOKEN_RE: OnceLock<Regex> = OnceLock::new();
+/// 匹配 token 内的单个成员：`key: "value"`，value 支持反斜杠转义
+static MEMBER_RE: OnceLock<Regex> = OnceLock::new();
+
+fn token_re() -> &'static Regex {
+    TOKEN_RE.get_or_init(|| {
+        Regex::new(r#"([A-Za-z_]+)(?-u:\s)*\{(?-u:\s)*((?:[A-Za-z_]+:(?-u:\s)*"(?:[^"\\]|\\.)*"(?-u:\s)*)*)\}"#)
+            .unwrap()
+    })
+}
+
+fn member_re() -> &'static Regex {
+    MEMBER_RE.get_or_init(|| Regex::new(r#"([A-Za-z_]+):(?-u:\s)*"((?:[^"\\]|\\.)*)""#).unwrap())
+}
+
 /// Reorder 类 - 用于解析和重新排序 token
 #[pyclass]
 #[derive(Debug)]
 pub struct Reorder {
     orders: HashMap<String, Vec<String>>,
-    index: usize,
-    text: String,
-    current_char: char,
-    tokens: Vec<Token>,
 }
 
 impl Reorder {
-    /// 加载输入文本并初始化解析器状态
-    fn load(&mut self, input: &str) -> PyResult<()> {
+    /// 解析输入文本为 tokens
+    ///
+    /// 使用预编译的正则一次扫描全部 token，token 之间只允许出现空白，
+    /// 否则视为格式错误。
+    fn parse<'a>(&self, input: &'a str) -> PyResult<Vec<Token<'a>>> {
         if input.is_empty() {
-            return Err(pyo3::exceptions::PyValueError::new_err("Input cannot be empty"));
-        }
-        
-        self.index = 0;
-        self.text = input.to_string();
-        self.current_char = self.text.chars().next().unwrap_or(EOS);
-        self.tokens.clear();
-        
-        Ok(())
-    }
-
-    /// 读取下一个字符
-    fn read(&mut self) -> bool {
-        if self.index < self.text.len().saturating_sub(1) {
-            self.index += 1;
-            self.current_char = self.text.chars().nth(self.index).unwrap_or(EOS);
-            true
-        } else {
-            self.current_char = EOS;
-            false
-        }
-    }
-
-    /// 解析空白字符
-    fn parse_ws(&mut self) -> bool {
-        let mut not_eos = self.current_char != EOS;
-        while not_eos && self.current_char == ' ' {
-            not_eos = self.read();
-        }
-        not_eos
-    }
-
-    /// 解析期望的字符
-    fn parse_char(&mut self, expected: char) -> bool {
-        if self.current_char == expected {
-            self.read();
-            true
-        } else {
-            false
-        }
-    }
-
-    /// 解析一组字符中的任意一个
-    fn parse_chars(&mut self, expected: &[char]) -> bool {
-        let mut ok = false;
-        for ch in expected.iter() {
-            ok |= self.parse_char(*ch);
-        }
-        ok
-    }
-
-    /// 解析 key（由 ASCII 字母和下划线组成）
-    fn parse_key(&mut self) -> PyResult<String> {
-        if self.current_char == EOS {
-            return Err(pyo3::exceptions::PyAssertionError::new_err("Unexpected EOS"));
-        }
-        if self.current_char.is_whitespace() {
-            return Err(pyo3::exceptions::PyAssertionError::new_err("Unexpected whitespace"));
-        }
-
-        let mut key = String::new();
-        while self.current_char.is_ascii_alphabetic() || self.current_char == '_' {
-            key.push(self.current_char);
-            self.read();
-        }
-        Ok(key)
-    }
-
-    /// 解析值（双引号包围的字符串，支持转义）
-    fn parse_value(&mut self) -> PyResult<String> {
-        if self.current_char == EOS {
-            return Err(pyo3::exceptions::PyAssertionError::new_err("Unexpected EOS"));
-        }
-
-        let mut value = String::new();
-
-        while self.current_char != '"' {
-            if self.current_char == EOS {
-                return Err(pyo3::exceptions::PyValueError::new_err("Unterminated string"));
+            return Err(pyo3::exceptions::PyValueError::new_err(
+                "Input cannot be empty",
+            ));
+        }
+
+        let mut tokens = Vec::new();
+        let mut last_end = 0;
+        for caps in token_re().captures_iter(input) {
+            let whole = caps.get(0).unwrap();
+            if !input[last_end..whole.start()].trim().is_empty() {
+                return Err(pyo3::exceptions::PyValueError::new_err(format!(
+                    "Malformed token at position {}",
+                    last_end
+                )));
             }
-            
-            let escape = self.current_char == '\\';
-            value.push(self.current_char);
-            self.read();
-            
-            if escape {
-                if self.current_char == EOS {
-                    return Err(pyo3::exceptions::PyValueError::new_err("Unexpected escape at EOS"));
-                }
-                value.push(self.current_char);
-                self.read();
+            last_end = whole.end();
+
+            let mut token = Token::new(caps.get(1).unwrap().as_str());
+            for member in member_re().captures_iter(caps.get(2).unwrap().as_str()) {
+                token.append(
+                    member.get(1).unwrap().as_str(),
+                    member.get(2).unwrap().as_str(),
+                );
             }
+            tokens.push(token);
+        }
+        if !input[last_end..].trim().is_empty() {
+            return Err(pyo3::exceptions::PyValueError::new_err(format!(
+                "Malformed token at position {}",
+                last_end
+            )));
         }
-        
-        Ok(value)
+
+        Ok(tokens)
     }
 
-    /// 解析输入文本为 tokens
-    fn parse(&mut self, input: &str) -> PyResult<()> {
-        self.load(input)?;
-        
-        while self.parse_ws() {
-            let name = self.parse_key()?;
-            self.parse_chars(&[' ', '{', ' ']);
+    /// 解析并按排序规则输出，不持有 GIL
+    fn reorder_text(&self, input: &str) -> PyResult<String> {
+        let tokens = self.parse(input)?;
 
-            let mut token = Token::new(name);
-            
-            while self.parse_ws() {
-                if self.current_char == '}' {
-                    self.parse_char('}');
-                    break;
-                }
-                
-                let key = self.parse_key()?;
-                self.parse_chars(&[':']);
-                self.parse_ws();
-                self.parse_char('"');
-                let value = self.parse_value()?;
-                self.parse_char('"');
-                token.append(key, value);
+        // 重排只改变成员顺序，输出长度与输入基本一致
+        let mut output = String::with_capacity(input.len());
+        for token in &tokens {
+            if !output.is_empty() {
+                output.push(' ');
             }
-            
-            self.tokens.push(token);
+            token.write_to(&mut output, &self.orders);
         }
-        
-        Ok(())
+        Ok(output)
     }
 }
 
@@ -209,10 +193,6 @@ impl Reorder {
     fn new() -> Self {
         Reorder {
             orders: default_orders(),
-            index: 0,
-            text: String::new(),
-            current_char: EOS,
-            tokens: Vec::new(),
         }
     }
 
@@ -228,18 +208,8 @@ impl Reorder {
     ///     >>> reorder = Reorder()
     ///     >>> reorder.reorder(r#"money { currency: \"USD\" value: \"100\" }"#)
     ///     'money { value: "100" currency: "USD" }'
-    fn reorder(&mut self, input: &str) -> PyResult<String> {
-        self.parse(input)?;
-        
-        let mut output = String::new();
-        for token in &self.tokens {
-            if !output.is_empty() {
-                output.push(' ');
-            }
-            output.push_str(&token.to_string(&self.orders));
-        }
-        
-        Ok(output)
+    fn reorder(&self, py: Python<'_>, input: &str) -> PyResult<String> {
+        py.allow_threads(|| self.reorder_text(input))
     }
 
     /// 获取当前的排序规则
@@ -1,5 +1,6 @@
 use pyo3::prelude::*;
 use regex::Regex;
+use std::borrow::Cow;
 use std::collections::HashSet;
 
 const LEVEL1_ENDINGS: [char; 7] = ['!', '?', '。', '？', '！', '；', ';'];
@@ -77,12 +78,24 @@ impl TextStreamSentencizer {
         } else {
             self.buffer.push_str(text);
         }
+        self.take_sentences()
+    }
 
-        let (sentences, indices) = self.split_sentences();
-
-        if !indices.is_empty() {
-            let remaining_start = indices.last().unwrap() + 1;
-            self.buffer = self.buffer[remaining_start..].to_string();
+    /// Feed a chunk of text character by character in a single call.
+    ///
+    /// Produces the same sentences as calling `push` once per character, but
+    /// crosses the Python/Rust boundary once for the whole chunk (and strips
+    /// emoji once instead of per character).
+    pub fn feed(&mut self, text: &str) -> Vec<String> {
+        let text = if self.remove_emoji {
+            Cow::Owned(remove_emojis(text))
+        } else {
+            Cow::Borrowed(text)
+        };
+        let mut sentences = Vec::new();
+        for c in text.chars() {
+            self.buffer.push(c);
+            sentences.extend(self.take_sentences());
         }
         sentences
     }
@@ -183,6 +196,20 @@ impl TextStreamSentencizer {
     }
 }
 
+// Rust-only helpers, kept out of #[pymethods] so they are not exposed to Python
+impl TextStreamSentencizer {
+    /// Split completed sentences off the buffer, keeping the remainder.
+    fn take_sentences(&mut self) -> Vec<String> {
+        let (sentences, indices) = self.split_sentences();
+
+        if !indices.is_empty() {
+            let remaining_start = indices.last().unwrap() + 1;
+            self.buffer = self.buffer[remaining_start..].to_string();
+        }
+        sentences
+    }
+}
+
 fn remove_emojis(input: &str) -> String {
     // 匹配常见 emoji 的 Unicode 范围
     let emoji_regex = Regex::new(
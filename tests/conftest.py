@@ -0,0 +1,27 @@
+"""Shared pytest fixtures."""
+
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import threading
+
+import pytest
+
+ASSETS_DIR = Path(__file__).parent.parent / "osc_data" / "assets"
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="session")
+def asset_server():
+    """Serve ``osc_data/assets`` over HTTP and yield the base URL."""
+    handler = partial(_QuietHandler, directory=str(ASSETS_DIR))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
@@ -1,13 +1,79 @@
 """Tests for osc_data.audio.Audio."""
 
 from pathlib import Path
+import asyncio
 import tempfile
 
 import librosa
 import numpy as np
 import pytest
 
-from osc_data.audio import Audio
+from osc_data._core import audio as core_audio
+from osc_data.audio import Audio, compute_decibel, low_frame_rate
+
+
+class TestAudioLoad:
+    """Tests for Audio.load."""
+
+    def test_load_example(self):
+        audio = Audio().load_example()
+        assert audio.sample_rate == 16000
+        assert audio.data.ndim == 1
+
+    @pytest.mark.parametrize("sample_rate", [None, 16000])
+    @pytest.mark.parametrize("mono", [None, True])
+    def test_load_matches_librosa(self, sample_rate, mono):
+        data = np.random.randn(2, 8000).astype(np.float32) * 0.1
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "stereo.wav"
+            Audio(data=data, sample_rate=22050).save(str(path))
+            audio = Audio(uri=str(path)).load(sample_rate=sample_rate, mono=mono)
+            expected, expected_sr = librosa.load(
+                str(path), sr=sample_rate, mono=bool(mono)
+            )
+        assert audio.sample_rate == expected_sr
+        assert audio.data.shape == expected.shape
+        np.testing.assert_allclose(audio.data, expected, atol=1e-6)
+
+    def test_load_url(self, asset_server):
+        audio = Audio(uri=f"{asset_server}/audio/example.wav").load()
+        local = Audio().load_example()
+        assert audio.sample_rate == local.sample_rate
+        np.testing.assert_array_equal(audio.data, local.data)
+
+    def test_load_url_not_found_raises(self, asset_server):
+        with pytest.raises(ValueError, match="Failed to load audio"):
+            Audio(uri=f"{asset_server}/audio/missing.wav").load()
+
+    def test_aload(self, asset_server):
+        async def load_both():
+            return await asyncio.gather(
+                Audio().load_example().aload(sample_rate=8000),
+                Audio(uri=f"{asset_server}/audio/example.wav").aload(),
+            )
+
+        resampled, remote = asyncio.run(load_both())
+        assert resampled.sample_rate == 8000
+        np.testing.assert_array_equal(remote.data, Audio().load_example().data)
+
+
+class TestAudioDuration:
+    """Tests for Audio.duration_s / duration_ms."""
+
+    def test_duration_matches_librosa(self):
+        audio = Audio().load_example()
+        expected = librosa.get_duration(y=audio.data, sr=audio.sample_rate)
+        assert audio.duration_s == pytest.approx(expected)
+        assert audio.duration_ms == pytest.approx(expected * 1000)
+
+    def test_duration_stereo(self):
+        audio = Audio(data=np.zeros((2, 8000), dtype=np.float32), sample_rate=16000)
+        assert audio.duration_s == pytest.approx(0.5)
+        assert audio.duration_ms == pytest.approx(500)
+
+    def test_duration_not_loaded(self):
+        assert Audio().duration_s == 0.0
+        assert Audio().duration_ms == 0.0
 
 
 class TestAudioSave:
@@ -79,3 +145,64 @@ class TestAudioSave:
         with tempfile.TemporaryDirectory() as tmpdir:
             with pytest.raises(ValueError, match="Sample rate is not set"):
                 audio.save(str(Path(tmpdir) / "x.wav"))
+
+
+class TestComputeDecibel:
+    """Tests for compute_decibel."""
+
+    @pytest.mark.parametrize("dtype", [np.float64, np.float32])
+    def test_matches_numpy(self, dtype):
+        x = np.random.rand(200, 400).astype(dtype)
+        expected = (
+            np.log10(np.sum(x.astype(np.float64) ** 2, axis=1, keepdims=True) + 1e-6)
+            * 10
+        )
+        y = compute_decibel(x)
+        assert y.shape == (200, 1)
+        np.testing.assert_allclose(y, expected, rtol=1e-5)
+
+    @pytest.mark.parametrize(
+        "dtype, scale", [(np.int16, 8000), (np.int32, 8000), (np.float16, 20)]
+    )
+    def test_integer_input_does_not_overflow(self, dtype, scale):
+        x = (np.random.uniform(-1, 1, (4, 4000)) * scale).astype(dtype)
+        expected = (
+            np.log10(np.sum(x.astype(np.float64) ** 2, axis=1, keepdims=True) + 1e-6)
+            * 10
+        )
+        np.testing.assert_allclose(compute_decibel(x), expected, rtol=1e-6)
+
+
+def _reference_lfr(x: np.ndarray, m: int, n: int) -> np.ndarray:
+    """Loop-based LFR on a single (T, F) sequence."""
+    T = x.shape[0]
+    padded = np.vstack([np.tile(x[0], ((m - 1) // 2, 1)), x])
+    outputs = []
+    for i in range(-(-T // n)):
+        window = padded[i * n : i * n + m]
+        if len(window) < m:
+            window = np.vstack([window, np.tile(padded[-1], (m - len(window), 1))])
+        outputs.append(window.reshape(-1))
+    return np.vstack(outputs)
+
+
+class TestLowFrameRate:
+    """Tests for low_frame_rate."""
+
+    @pytest.mark.parametrize(
+        "shape, m, n",
+        [((2, 100, 80), 7, 6), ((2, 300, 560), 7, 6), ((1, 50, 10), 5, 1)],
+    )
+    def test_matches_reference(self, shape, m, n):
+        x = np.random.randn(*shape)
+        y = low_frame_rate(x, m, n)
+        expected = np.stack([_reference_lfr(seq, m, n) for seq in x])
+        np.testing.assert_array_equal(y, expected)
+        np.testing.assert_array_equal(y, core_audio.low_frame_rate(x, m, n))
+
+    def test_sequence_shorter_than_window(self):
+        x = np.random.randn(1, 3, 4).astype(np.float32)
+        y = low_frame_rate(x, 7, 6)
+        assert y.shape == (1, 1, 28)
+        assert y.dtype == np.float32
+        np.testing.assert_array_equal(y[0], _reference_lfr(x[0], 7, 6))
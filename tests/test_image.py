@@ -57,6 +57,14 @@ class TestImageLoad:
         assert img.height == 256
         assert img.color_mode == "RGB"
 
+    def test_load_url(self, asset_server):
+        """Test loading an image from a URL through the pooled HTTP session."""
+        img = Image(uri=f"{asset_server}/image/example_rgb.png").load()
+        local = Image(uri=str(ASSETS_DIR / "example_rgb.png")).load()
+
+        np.testing.assert_array_equal(img.data, local.data)
+        assert img.source_format == "png"
+
     def test_load_without_uri_raises(self):
         """Test that loading without URI raises ValueError."""
         img = Image()
@@ -1,3 +1,5 @@
+from functools import cache
+
 import numpy as np
 import torch
 import time
@@ -53,6 +55,34 @@ def numpy_lfr(x: np.ndarray, lfr_m: int, lfr_n: int):
     return LFR_outputs, spent
 
 
+@cache
+def _lfr_numba():
+    # numba is only needed for the benchmark, not a declared dependency
+    import numba
+
+    @numba.njit(parallel=True)
+    def kernel(x, lfr_m, lfr_n, out):
+        T, D = x.shape
+        left_padding = (lfr_m - 1) // 2
+        for i in numba.prange(out.shape[0]):
+            for j in range(lfr_m):
+                # clamp into [0, T) == repeat first frame on the left, last on the right
+                t = min(max(i * lfr_n + j - left_padding, 0), T - 1)
+                out[i, j * D : (j + 1) * D] = x[t]
+
+    return kernel
+
+
+def numba_lfr(x: np.ndarray, lfr_m: int, lfr_n: int):
+    start = time.perf_counter()
+    T_lfr = int(np.ceil(x.shape[0] / lfr_n))
+    LFR_outputs = np.empty((T_lfr, lfr_m * x.shape[1]), dtype=np.float32)
+    _lfr_numba()(x, lfr_m, lfr_n, LFR_outputs)
+    end = time.perf_counter()
+    spent = end - start
+    return LFR_outputs, spent
+
+
 def lfr(x: np.ndarray, lfr_m: int, lfr_n: int):
     from osc_data.audio import low_frame_rate
 
@@ -73,6 +103,9 @@ if __name__ == "__main__":
     r1_spent = []
     r2 = []
     r2_spent = []
+    r4 = []
+    r4_spent = []
+    numba_lfr(arr[0, :10], lfr_m, lfr_n)  # JIT warm-up
     for i in range(2):
         rr1, rr1_spent = torch_lfr(arr[i], lfr_m, lfr_n)
         r1.append(rr1)
@@ -80,13 +113,22 @@ if __name__ == "__main__":
         rr2, rr2_spent = numpy_lfr(arr[i], lfr_m, lfr_n)
         r2.append(rr2)
         r2_spent.append(rr2_spent)
+        rr4, rr4_spent = numba_lfr(arr[i], lfr_m, lfr_n)
+        r4.append(rr4)
+        r4_spent.append(rr4_spent)
     r1 = np.array(r1)
     r1_spent = sum(r1_spent)
     r2 = np.array(r2)
     r2_spent = sum(r2_spent)
+    r4 = np.array(r4)
+    r4_spent = sum(r4_spent)
     r3, r3_spent = lfr(arr, lfr_m, lfr_n)
     assert np.allclose(r1, r3), "not equal"
     assert np.allclose(r2, r3), "not equal"
-    print(f"torch_lfr: {r1_spent}, numpy_lfr: {r2_spent}, rust_lfr: {r3_spent}")
+    assert np.allclose(r4, r3), "not equal"
+    print(
+        f"torch_lfr: {r1_spent}, numpy_lfr: {r2_spent}, numba_lfr: {r4_spent}, rust_lfr: {r3_spent}"
+    )
     print(f"对比torch: {r1_spent / r3_spent}")
     print(f"对比numpy: {r2_spent / r3_spent}")
+    print(f"对比numba: {r4_spent / r3_spent}")
@@ -1,5 +1,7 @@
 """Tests for the Reorder class implemented in Rust."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from osc_data._core import reorder as core_reorder
 
@@ -87,6 +89,13 @@ class TestReorder:
         with pytest.raises(ValueError, match="Input cannot be empty"):
             reorder.reorder("")
 
+    def test_malformed_input_raises_error(self):
+        """Test that an unterminated token raises a ValueError."""
+        reorder = core_reorder.Reorder()
+
+        with pytest.raises(ValueError):
+            reorder.reorder('money { currency: "USD" value: "100')
+
     def test_unknown_token_type_not_reordered(self):
         """Test that unknown token types are not reordered."""
         reorder = core_reorder.Reorder()
@@ -186,6 +195,26 @@ class TestReorderIntegration:
         expected = 'money { value: "100" currency: "USD" }'
         assert result == expected
 
+    def test_normalizer_reuses_reorder(self):
+        """Test that TextNormalizer keeps a single Reorder across calls."""
+        from osc_data.text import TextNormalizer
+
+        normalizer = TextNormalizer(cache_size=0)
+        reorder = normalizer.reorder
+        normalizer.normalize("我有100元")
+        normalizer.normalize("今天是3月15日")
+        assert normalizer.reorder is reorder
+
+    def test_shared_reorder_across_threads(self):
+        """Test that one Reorder instance can serve several threads."""
+        reorder = core_reorder.Reorder()
+        inputs = [f'money {{ currency: "USD" value: "{i}" }}' for i in range(200)]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(reorder.reorder, inputs))
+        assert results == [
+            f'money {{ value: "{i}" currency: "USD" }}' for i in range(200)
+        ]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -5,11 +5,17 @@ sentencizer = TextStreamSentencizer()
 
 text = "有个阿姨特别聪明，她同时接两个钟点工单，上午一家下午一家，收入比全职还高！现在客户都抢着要她。记住啊姐妹们，刚开始别挑活，积累经验最重要。"
 
-sents = []
-for c in text:
-    sents.extend(sentencizer.push(c))
+sents = sentencizer.feed(text)
 sents.extend(sentencizer.flush())
 
+# feed() matches pushing one character at a time
+push_sentencizer = TextStreamSentencizer()
+pushed = []
+for c in text:
+    pushed.extend(push_sentencizer.push(c))
+pushed.extend(push_sentencizer.flush())
+assert sents == pushed, (sents, pushed)
+
 assert (
     sents[0]
     == "有个阿姨特别聪明，她同时接两个钟点工单，上午一家下午一家，收入比全职还高！"
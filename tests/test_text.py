@@ -0,0 +1,65 @@
+"""Tests for osc_data.text."""
+
+from osc_data.text import TextNormalizer, TextCleaner, preload_fsts
+
+
+class TestTextNormalizer:
+    """Tests for TextNormalizer."""
+
+    def test_normalize_money(self):
+        normalizer = TextNormalizer()
+        assert normalizer.normalize("我有100元") == "我有一百元"
+
+    def test_normalize_multiple_sentences(self):
+        normalizer = TextNormalizer()
+        assert (
+            normalizer.normalize("我有100元。今天是3月15日！")
+            == "我有一百元.今天是三月十五日!"
+        )
+
+    def test_normalize_cache_hit(self):
+        normalizer = TextNormalizer()
+        first = normalizer.normalize("我有100元")
+        second = normalizer.normalize("我有100元")
+        assert first == second
+        info = normalizer._cache.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
+    def test_batch_normalize(self):
+        normalizer = TextNormalizer()
+        texts = ["我有100元", "今天是3月15日", "我有100元"]
+        assert normalizer.batch_normalize(texts) == [
+            normalizer.normalize(text) for text in texts
+        ]
+
+    def test_cache_clear(self):
+        normalizer = TextNormalizer()
+        normalizer.normalize("我有100元")
+        normalizer.cache_clear()
+        assert normalizer._cache.cache_info().currsize == 0
+
+    def test_model_copy_uses_own_settings(self):
+        normalizer = TextNormalizer()
+        text = "我有100元😀"
+        original = normalizer.normalize(text)
+        copied = normalizer.model_copy(update={"remove_emoji": True})
+        assert copied._cache is not normalizer._cache
+        assert copied.normalize(text) == "我有一百元"
+        assert normalizer.normalize(text) == original
+
+    def test_preload_fsts_shared(self):
+        preload_fsts()
+        first = TextNormalizer()
+        second = TextNormalizer(remove_erhua=True)
+        assert first.tagger is second.tagger
+        assert first.verbalizer is not second.verbalizer
+        assert TextNormalizer().verbalizer is first.verbalizer
+
+
+class TestTextCleaner:
+    """Tests for TextCleaner."""
+
+    def test_clean(self):
+        cleaner = TextCleaner(remove_emoji=True, to_half_width=True)
+        assert cleaner.clean("Ｈｅｌｌｏ！😀你好") == "Hello!你好"
@@ -1,13 +1,16 @@
 """Tests for the Video class."""
 
 from pathlib import Path
+import asyncio
+import gc
 import tempfile
+import weakref
 
 import av
 import numpy as np
 import pytest
 
-from osc_data.video import Video
+from osc_data.video import Video, _decode_frames
 from osc_data.audio import Audio
 
 ASSETS_DIR = Path(__file__).parent.parent / "osc_data" / "assets" / "video"
@@ -53,6 +56,198 @@ class TestVideoLoad:
         assert video.key_frames is not None
         assert isinstance(video.key_frames, list)
 
+    def test_load_url(self, asset_server):
+        """Test streaming a video from a URL."""
+        video = Video(uri=f"{asset_server}/video/example.mp4").load()
+        local = Video(uri=str(ASSETS_DIR / "example.mp4")).load()
+
+        np.testing.assert_array_equal(video.data, local.data)
+        assert video.fps == local.fps
+        assert video.key_frames == local.key_frames
+
+    def test_load_url_not_found_raises(self, asset_server):
+        """Test that a missing remote video raises RuntimeError."""
+        with pytest.raises(RuntimeError, match="Failed to load video"):
+            Video(uri=f"{asset_server}/video/missing.mp4").load()
+
+    def test_aload(self, asset_server):
+        """Test loading several videos concurrently from an event loop."""
+        video_path = str(ASSETS_DIR / "example.mp4")
+
+        async def load_both():
+            return await asyncio.gather(
+                Video(uri=video_path).aload(stride=2),
+                Video(uri=f"{asset_server}/video/example.mp4").aload(),
+            )
+
+        sampled, remote = asyncio.run(load_both())
+        assert sampled.data.shape[0] == 30
+        assert remote.data.shape[0] == 60
+
+    def test_load_many(self):
+        """Test loading a batch of videos on a thread pool."""
+        video_path = ASSETS_DIR / "example.mp4"
+        videos = Video.load_many([video_path, str(video_path)], stride=3)
+        assert len(videos) == 2
+        assert all(video.data.shape[0] == 20 for video in videos)
+
+    def test_load_with_stride_and_max_frames(self):
+        """Test sampling frames during load."""
+        video_path = str(ASSETS_DIR / "example.mp4")
+        full = Video(uri=video_path).load()
+        sampled = Video(uri=video_path).load(stride=4, max_frames=10)
+
+        np.testing.assert_array_equal(sampled.data, full.data[::4][:10])
+        assert sampled.fps == round(30 / 4)
+        assert sampled.duration == round(10 * 4 / 30, 2)
+        assert sampled.key_frames == [0]
+
+    def test_load_invalid_stride_raises(self):
+        """Test that a non-positive stride is rejected."""
+        with pytest.raises(ValueError, match="stride"):
+            Video(uri=str(ASSETS_DIR / "example.mp4")).load(stride=0)
+
+    def test_load_invalid_max_frames_raises(self):
+        """Test that a non-positive max_frames is rejected."""
+        with pytest.raises(ValueError, match="max_frames"):
+            Video(uri=str(ASSETS_DIR / "example.mp4")).load(max_frames=0)
+
+    def test_load_max_frames_not_reached_keeps_duration(self):
+        """Test that an unreached max_frames does not change the duration."""
+        video_path = str(ASSETS_DIR / "example.mp4")
+        full = Video(uri=video_path).load()
+        sampled = Video(uri=video_path).load(stride=7, max_frames=100)
+        assert len(sampled.data) == len(full.data[::7])
+        assert sampled.duration == full.duration
+
+    def test_load_large_stride_keeps_positive_fps(self):
+        """Test that fps is clamped to 1 when stride exceeds the frame rate."""
+        video = Video(uri=str(ASSETS_DIR / "example.mp4")).load(stride=1000)
+        assert video.fps == 1
+        assert len(video.data) == 1
+
+    def test_load_hwaccel_falls_back_to_software(self):
+        """Test that an unavailable hardware decoder falls back to software."""
+        video_path = str(ASSETS_DIR / "example.mp4")
+        video = Video(uri=video_path).load(hwaccel="cuda")
+        np.testing.assert_array_equal(video.data, Video(uri=video_path).load().data)
+
+    def test_decode_frames_without_frame_count(self):
+        """Test decoding a stream whose container does not report a frame count."""
+        data = np.random.randint(0, 256, (13, 32, 32, 3), dtype=np.uint8)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = str(Path(tmp_dir) / "video.mkv")
+            Video(data=data, fps=5).save(path, format="matroska")
+            with av.open(path) as container:
+                assert container.streams.video[0].frames == 0
+                frames, key_frames = _decode_frames(container)
+        assert frames.shape == (13, 32, 32, 3)
+        assert key_frames[0] == 0
+
+    def test_load_without_stream_duration(self):
+        """Test load falls back to the container duration (Matroska)."""
+        data = np.random.randint(0, 256, (10, 32, 32, 3), dtype=np.uint8)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = str(Path(tmp_dir) / "video.mkv")
+            Video(data=data, fps=5).save(path, format="matroska")
+            video = Video(uri=path).load()
+        assert video.data.shape == (10, 32, 32, 3)
+        assert video.fps == 5
+        assert video.duration == pytest.approx(2.0, abs=0.2)
+
+    def test_decode_frames_into_borrowed_buffer(self):
+        """Test growing/trimming a buffer that does not own its memory."""
+        data = np.random.randint(0, 256, (13, 32, 32, 3), dtype=np.uint8)
+
+        def empty(shape):
+            # A view, like the numpy side of a pinned torch tensor
+            return np.empty((shape[0] + 1,) + shape[1:], dtype=np.uint8)[1:]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = str(Path(tmp_dir) / "video.mkv")
+            Video(data=data, fps=5).save(path, format="matroska")
+            with av.open(path) as container:
+                frames, _ = _decode_frames(container, empty=empty)
+            with av.open(path) as container:
+                expected, _ = _decode_frames(container)
+        assert not frames.flags.owndata
+        np.testing.assert_array_equal(frames, expected)
+
+    def test_load_pin_memory(self):
+        """Test decoding into pinned host memory."""
+        torch = pytest.importorskip("torch")
+        if not torch.cuda.is_available():
+            pytest.skip("pinned memory requires CUDA")
+        video_path = str(ASSETS_DIR / "example.mp4")
+        video = Video(uri=video_path).load(pin_memory=True)
+        assert torch.from_numpy(video.data).is_pinned()
+        np.testing.assert_array_equal(video.data, Video(uri=video_path).load().data)
+
+
+class TestVideoSplit:
+    """Tests for key frame splitting."""
+
+    @staticmethod
+    def _make_video(key_frames: list[int]) -> Video:
+        data = np.arange(20, dtype=np.uint8).reshape(20, 1, 1, 1)
+        data = np.broadcast_to(data, (20, 4, 4, 3)).copy()
+        return Video(data=data, fps=2, key_frames=key_frames)
+
+    def test_split_by_key_frames(self):
+        video = self._make_video([0, 4, 6, 12, 15])
+        segments = video.split_by_key_frames(min_split_duration_s=2)
+        assert [len(s) for s in segments] == [4, 8, 8]
+        assert segments[1][0, 0, 0, 0] == 4
+        # Segments are views into the video data
+        assert all(np.shares_memory(s, video.data) for s in segments)
+
+    def test_split_single_key_frame(self):
+        video = self._make_video([0])
+        segments = video.split_by_key_frames()
+        assert len(segments) == 1
+        assert len(segments[0]) == 20
+
+    def test_split_without_key_frames_raises(self):
+        video = Video(data=np.zeros((2, 4, 4, 3), dtype=np.uint8), fps=2)
+        with pytest.raises(ValueError, match="Key frames are not set"):
+            video.split_by_key_frames()
+
+    def test_iter_key_frame_segments_is_lazy(self):
+        video = self._make_video([0, 4, 8, 12, 16])
+        segments = video.iter_key_frame_segments(min_split_duration_s=2)
+        assert len(next(segments)) == 4
+        assert len(next(segments)) == 4
+
+
+class TestVideoPlanar:
+    """Tests for the planar frame layout."""
+
+    def test_planar_layout(self):
+        data = np.random.randint(0, 256, (3, 4, 5, 3), dtype=np.uint8)
+        video = Video(data=data, fps=2)
+        planar = video.planar
+        assert planar.shape == (3, 3, 4, 5)
+        assert planar.flags["C_CONTIGUOUS"]
+        np.testing.assert_array_equal(planar[1], data[..., 1])
+
+    def test_planar_cached_until_data_changes(self):
+        video = Video(data=np.zeros((2, 4, 4, 3), dtype=np.uint8), fps=2)
+        assert video.planar is video.planar
+        video.data = np.ones((2, 4, 4, 3), dtype=np.uint8)
+        assert video.planar.min() == 1
+
+    def test_planar_cache_released_on_reassign(self):
+        video = Video(data=np.zeros((2, 4, 4, 3), dtype=np.uint8), fps=2)
+        old_data = weakref.ref(video.data)
+        old_planar = weakref.ref(video.planar)
+        video.data = np.ones((2, 4, 4, 3), dtype=np.uint8)
+        gc.collect()
+        assert old_data() is None
+        assert old_planar() is None
+
+    def test_planar_without_data(self):
+        assert Video().planar is None
+
 
 class TestVideoSave:
     """Tests for video saving functionality."""
@@ -73,6 +268,21 @@ class TestVideoSave:
             assert saved_video.width == video.width
             assert saved_video.height == video.height
 
+    def test_save_preserves_frame_content(self):
+        """Test that every frame is encoded from its own data, in order."""
+        levels = np.arange(0, 240, 16, dtype=np.uint8)
+        data = np.broadcast_to(levels[:, None, None, None], (15, 32, 48, 3)).copy()
+        video = Video(data=data, fps=5)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out = Path(tmpdir) / "levels.mp4"
+            video.save(str(out))
+            saved = Video(uri=str(out)).load()
+
+        assert saved.data.shape == data.shape
+        means = saved.data.reshape(15, -1).mean(axis=1)
+        np.testing.assert_allclose(means, levels, atol=4)
+
     def test_save_overwrites_existing_file(self):
         """目标路径已存在时覆盖写入，不报错。"""
         video_path = ASSETS_DIR / "example.mp4"